@@ -41,8 +41,7 @@ class WindowBase:
         # clear references
         title = self.title
         window = self.window
-        # copy to avoid modification during iteration
-        components = self.components.copy()
+        components = list(self.components.values())
         
         # reset state
         self.title = ''
@@ -52,10 +51,14 @@ class WindowBase:
         # add window to engine first
         self.engine.add(window)
         
-        # Then register and add components
-        for name, component in components.items():
-            component.register_all(self.engine.bus)
-            window.add(component)
+        # Then register and add components, one batch each
+        nodes = []
+        for component in components:
+            if isinstance(component, Toolbar):
+                component.end_batch()
+            nodes.extend(component.subtree())
+        self.engine.bus.register_many(nodes)
+        window.add_many(components)
 
 class Gui(WindowBase):
     def __init__(self, engine: Component):
@@ -65,6 +68,8 @@ class Gui(WindowBase):
         self.offset = 0
         self.header = 24
         self.padding = 2
+        self._component_seq = 0
+        self._toolbar_seq = 0
         
     def add_header(self, title: str, extra: bool = True) -> 'Gui':
         if self.window:
@@ -128,10 +133,10 @@ class Gui(WindowBase):
     def add_load(self, resistance: float = 1.0) -> 'Gui':
         if self.window:
             dl = DummyLoad(resistance)
-            ref = str(len(self.components)+1)
+            self._component_seq += 1
             dl.name = 'artificial_load'
             self.components.update({
-                'dummy_'+ ref: dl,
+                f'dummy_{self._component_seq}': dl,
             })
         return self
     
@@ -153,7 +158,8 @@ class Gui(WindowBase):
                 _height = self.last_row.y + self.last_row.height
                 
             # create toolbar
-            ref = str(len(self.components)+1)
+            self._toolbar_seq += 1
+            ref = self._toolbar_seq
             row = Toolbar(self.padding, _height, self.window.width-self.padding*2, self.header, Alignment.CENTER, Alignment.CENTER)
             row.name = f'toolbar_{ref}'
             row.passthrough = True
@@ -161,8 +167,10 @@ class Gui(WindowBase):
             row.border_style = 0
             row.filler = True
             row.filler_style = 0
+            # items are laid out once, when the window is finalized
+            row.begin_batch()
             self.components.update({
-                'toolbar_' + ref: row,
+                f'toolbar_{ref}': row,
             })
             # update position
             self.offset = (row.width * 0.90)
@@ -180,7 +188,8 @@ class Gui(WindowBase):
             _x = self.padding + (_width * _length)
             
             item = Performance(_x, 2, _width, self.last_row.height - 4)
-            item.name = 'monitor_' + str(_length)  # Unique names
+            self._component_seq += 1
+            item.name = f'monitor_{self._component_seq}'
             item.passthrough = False
             item.border = True
             item.border_style = 2
@@ -197,7 +206,8 @@ class Gui(WindowBase):
             _x = self.padding + (_width * _length)
 
             item = Label(_x, 2, _width, self.last_row.height - 4, caption)
-            item.name = 'label_' + str(_length)  # Unique names
+            self._component_seq += 1
+            item.name = f'label_{self._component_seq}'
             item.passthrough = False
             item.border = False
             item.filler = False
@@ -213,7 +223,8 @@ class Gui(WindowBase):
             _x = self.padding + (_width * _length)
 
             item = Button(_x, 2, _width, self.last_row.height - 4, caption)
-            item.name = 'button_' + str(_length)  # Unique names
+            self._component_seq += 1
+            item.name = f'button_{self._component_seq}'
             item.passthrough = False
             item.on_click = cb
             self.last_row.add(item)
@@ -228,7 +239,8 @@ class Gui(WindowBase):
             _x = self.padding + (_width * _length)
             
             item = Slider(_x, 2, _width, self.last_row.height - 4, min_value, max_value, (min_value + max_value) // 2, cb)
-            item.name = 'slider_' + str(_length)  # Unique names
+            self._component_seq += 1
+            item.name = f'slider_{self._component_seq}'
             item.passthrough = False
             item.border = True
             item.border_style = 2
@@ -1,7 +1,7 @@
 # bus.py
+from collections import deque
 from enum import IntEnum
-from dataclasses import dataclass
-from typing import Any, List, Dict, TYPE_CHECKING
+from typing import Any, List, Dict, Deque, Tuple, Callable, Optional, Iterable, NamedTuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from component import Component
@@ -10,6 +10,9 @@ if TYPE_CHECKING:
 BROADCAST = -1
 MASTER = 0
 
+# trace (un)registration
+DEBUG = False
+
 
 class Response(IntEnum):
     # generic (dialog) states
@@ -35,8 +38,7 @@ class Response(IntEnum):
     M_PULSE = 33     # component is touched
     
 
-@dataclass(frozen=True)
-class Packet:
+class Packet(NamedTuple):
     receiver: int
     sender: int
     rs: Response = Response.M_OK
@@ -44,16 +46,25 @@ class Packet:
 
 
 class AddressBus:
+    # broadcasts where only the latest packet per pump matters
+    _coalesce_rs = frozenset((Response.M_THEME, Response.M_REDRAW))
+
     __slots__ = (
         "_messages",
+        "_latest",
         "_components",
+        "_handlers",
+        "_targets",
         "_next_addr",
         "_max_queue_size",
     )
 
     def __init__(self, max_queue_size: int = 255):
-        self._messages: List[Packet] = []
+        self._messages: Deque[Packet] = deque(maxlen=max_queue_size)
+        self._latest: Dict[Response, int] = {}
         self._components: Dict[int, 'Component'] = {}
+        self._handlers: Dict[int, Callable[[Packet], None]] = {}
+        self._targets: Optional[List[Tuple[int, Callable[[Packet], None]]]] = None
         self._next_addr = 0
         self._max_queue_size = max_queue_size
 
@@ -61,51 +72,90 @@ class AddressBus:
     # Registration
     
     def register(self, component: 'Component') -> int:
-        addr = getattr(component, "address", -1)
-        if addr < 0:
-            addr = self._next_addr
-            self._next_addr += 1
-            component.address = addr
-        
-        self._components[addr] = component
-        print(f'[added] 0x{component.address}: {component.name}({component.rect})')
-        return addr
+        self.register_many((component,))
+        return component.address
+
+    def register_many(self, components: Iterable['Component']) -> None:
+        """Register a batch, unaddressed components get consecutive addresses."""
+        registry = self._components
+        handlers = self._handlers
+        for component in components:
+            addr = component.address
+            if addr < 0:
+                addr = self._next_addr
+                self._next_addr += 1
+                component.address = addr
+            
+            registry[addr] = component
+            handler = getattr(component, "handle_message", None)
+            if handler:
+                handlers[addr] = handler
+            else:
+                handlers.pop(addr, None)
+            if DEBUG:
+                print(f'[added] 0x{component.address}: {component.name}({component.rect})')
+        self._targets = None
 
     def unregister(self, component: 'Component') -> None:
         self._components.pop(component.address, None)
-        print(f'[removed] 0x{component.address}: {component.name}({component.rect})')
+        self._handlers.pop(component.address, None)
+        self._targets = None
+        if DEBUG:
+            print(f'[removed] 0x{component.address}: {component.name}({component.rect})')
     
     # Posting
     def post(self, msg: Packet) -> bool:
         """Queue a message; return False if full."""
+        if msg.receiver == BROADCAST and msg.rs in self._coalesce_rs:
+            index = self._latest.get(msg.rs)
+            if index is not None:
+                # supersede the pending packet in place
+                self._messages[index] = msg
+                return True
+            if len(self._messages) >= self._max_queue_size:
+                return False
+            self._latest[msg.rs] = len(self._messages)
+            self._messages.append(msg)
+            return True
         if len(self._messages) >= self._max_queue_size:
             return False
         self._messages.append(msg)
         return True
 
+    def pending(self) -> int:
+        """Number of queued messages"""
+        return len(self._messages)
+
     # Pump
     def pump(self) -> None:
-        """Process all queued messages in FIFO order."""
+        """Process all queued messages in FIFO order, never looping back to the sender."""
         queue = self._messages
         if not queue:
             return
 
-        self._messages = []
+        self._messages = deque(maxlen=self._max_queue_size)
+        self._latest.clear()
+
+        handlers = self._handlers
+        if not handlers:
+            # nobody to deliver to (engine not registered yet / torn down)
+            return
 
         for msg in queue:
+            sender = msg.sender
             if msg.receiver == BROADCAST:
-                # Snapshot list to allow safe mutation during dispatch
-                targets = list(self._components.values())
-                for comp in targets:
-                    handler = getattr(comp, "handle_message", None)
-                    if handler:
-                        handler(msg)
-            else:
-                comp = self._components.get(msg.receiver)
-                if comp:
-                    handler = getattr(comp, "handle_message", None)
-                    if handler:
+                # Snapshot is rebuilt only after (un)registration, so
+                # mutation during dispatch never touches the list we iterate
+                targets = self._targets
+                if targets is None:
+                    targets = self._targets = list(handlers.items())
+                for addr, handler in targets:
+                    if addr != sender:
                         handler(msg)
+            elif msg.receiver != sender:
+                handler = handlers.get(msg.receiver)
+                if handler:
+                    handler(msg)
 
     
     # Peek
@@ -1,14 +1,48 @@
+import math
 import time
 import random
 import pygame
+from functools import lru_cache
 from pygame.event import Event
-from typing import Optional, Tuple, Dict, Callable, Any, List, Set, TYPE_CHECKING
+from typing import Optional, Tuple, Dict, Callable, Any, List, Set, Union, NamedTuple, TYPE_CHECKING
 from bus import BROADCAST, MASTER, Response, Packet, AddressBus
 
 if TYPE_CHECKING:
     from component import Component
 
+# event name -> handler table attribute
+EVENT_SLOTS = {
+    'click'     : '_on_click',
+    'hover'     : '_on_hover',
+    'focus'     : '_on_focus',
+    'blur'      : '_on_blur',
+    'keypress'  : '_on_keypress',
+}
+
+# synthetic event handed to blur handlers when focus moves to a sibling
+_BLUR_EVENT = pygame.event.Event(pygame.USEREVENT, synthetic=True)
+
+# pointer events a container can skip when the cursor is outside its rect
+CULLED_EVENTS = frozenset((pygame.MOUSEMOTION, pygame.MOUSEBUTTONUP))
+
+class ThemeColors(NamedTuple):
+    """Parsed palette carried by M_THEME packets, shared by all receivers.
+    The Colors are cached and read-only: assign new ones, never mutate them in place."""
+    bg: pygame.Color
+    fg: pygame.Color
+    shade: pygame.Color
+    font_small: pygame.Color
+    font_big: pygame.Color
+    hue: float
+    contrast: float
+
 class Dispatcher:
+    # event types the tree reacts to, the engine drains only these (plus its own)
+    ACCEPTED_EVENTS = (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION, pygame.KEYDOWN)
+    _accepted_types = frozenset(ACCEPTED_EVENTS)
+    # False for components without an on-screen area (e.g. DummyLoad), they see every pointer event
+    spatial = True
+    
     def __init__(self):
         # states
         self.visible = True
@@ -22,12 +56,20 @@ class Dispatcher:
         # interaction
         self.active = False
         self.passthrough = False
+        self._active_child: Optional['Component'] = None  # focus is exclusive among siblings
+        self.pointer_grab: Optional['Component'] = None  # used on the root only
+        self._cullable = self.spatial  # False once a non-spatial component is below us
         
         # events
         self.terminated = False
-        self.events: Dict[str, List[Callable]] = {
-            event: [] for event in ['click', 'hover', 'focus', 'blur', 'keypress']
-        }
+        self._handler_seq = 0
+        self._dispatching = 0  # nesting depth of _dispatch on this component
+        self._deferred: List[Tuple[str, Optional[int], Union[int, Callable]]] = []
+        self._on_click: Dict[int, Callable] = {}
+        self._on_hover: Dict[int, Callable] = {}
+        self._on_focus: Dict[int, Callable] = {}
+        self._on_blur: Dict[int, Callable] = {}
+        self._on_keypress: Dict[int, Callable] = {}
     
     # Core methods
     def draw(self, surface: pygame.Surface) -> None:
@@ -45,9 +87,23 @@ class Dispatcher:
         """Process event through hierarchy, returns True if event was consumed"""
         if not self.enabled:
             return False
+        if self.parent is None:
+            if event.type not in self._accepted_types:
+                return False
+            # a dragged component keeps the pointer even outside its rect
+            grab = self.pointer_grab
+            if grab is not None and event.type in CULLED_EVENTS:
+                if grab.terminated:
+                    self.pointer_grab = None
+                elif grab.process_event(event):
+                    return True
+        elif self._cullable and event.type in CULLED_EVENTS and not self.get_absolute_rect().collidepoint(event.pos):
+            # clicks still descend everywhere so focused widgets can blur
+            return False
         # container first (reverse, front-to-back)
-        for child in reversed(self.children):
-            if child.handle_event(event):
+        children = self.children
+        for i in range(len(children) - 1, -1, -1):
+            if children[i].handle_event(event):
                 return True
                 
         return self.process_event(event)
@@ -72,63 +128,145 @@ class Dispatcher:
             if self.parent:
                 self.parent.deactivate_container(self)
             # trigger 'focus' if state changes
+            # (empty handler tables are the common case, skip the iteration)
             if not self.active:
                 self.active = True
-                self.trigger('focus', event)
-            self.trigger('click', event)
+                if self._on_focus:
+                    self._dispatch(self._on_focus, event)
+            if self._on_click:
+                self._dispatch(self._on_click, event)
             return True
         elif self.active:
             # focus lost
             self.active = False
-            self.trigger('blur', event)
+            if self._on_blur:
+                self._dispatch(self._on_blur, event)
             
         return False
     
     def _handle_mouse_motion(self, event: Event) -> bool:
         """Handle mouse motion events"""
         if self.is_inside(event.pos):
-            self.trigger('hover', event)
+            if self._on_hover:
+                self._dispatch(self._on_hover, event)
             return True
         return False
     
     def _handle_keypress(self, event: Event) -> bool:
         """Handle keyboard events"""
-        self.trigger('keypress', event)
+        if self._on_keypress:
+            self._dispatch(self._on_keypress, event)
         return True
     
+    def _uncull(self) -> None:
+        """Stop culling pointer events here and above (stays off after removal)"""
+        node = self
+        while node is not None and node._cullable:
+            node._cullable = False
+            node = node.parent
+    
     def deactivate_container(self, root=None) -> None:
         """Deactivate all children except the specified root"""
-        for child in self.children:
-            if child != root and child.active:
-                child.active = False
-                child.trigger('blur', pygame.event.Event(pygame.USEREVENT))
+        child = self._active_child
+        if child is not None and child is not root and child.active:
+            child.active = False
+            if child._on_blur:
+                child._dispatch(child._on_blur, _BLUR_EVENT)
+        self._active_child = root
+    
+    # Pointer capture
+    def capture_pointer(self) -> None:
+        """Route motion/release events to this component first (drags)"""
+        node = self
+        while node.parent:
+            node = node.parent
+        node.pointer_grab = self
+    
+    def release_pointer(self) -> None:
+        node = self
+        while node.parent:
+            node = node.parent
+        if node.pointer_grab is self:
+            node.pointer_grab = None
     
     # Event Registration API
-    def on(self, event_type: str, handler: Callable) -> None:
-        """Register event handler"""
-        if event_type in self.events:
-            self.events[event_type].append(handler)
+    def on(self, event_type: str, handler: Callable) -> int:
+        """Register event handler, returns its key for off()"""
+        slot = EVENT_SLOTS.get(event_type)
+        if not slot:
+            return -1
+        self._handler_seq += 1
+        if self._dispatching:
+            # a handler is running, the table can't grow under its loop
+            self._deferred.append((slot, self._handler_seq, handler))
+        else:
+            getattr(self, slot)[self._handler_seq] = handler
+        return self._handler_seq
+    
+    def off(self, event_type: str, handler: Union[int, Callable]) -> None:
+        """Unregister event handler by key, or by the handler itself"""
+        slot = EVENT_SLOTS.get(event_type)
+        if not slot:
+            return
+        if self._dispatching:
+            self._deferred.append((slot, None, handler))
+        else:
+            self._remove_handler(slot, handler)
+    
+    def _remove_handler(self, slot: str, handler: Union[int, Callable]) -> None:
+        handlers = getattr(self, slot)
+        if isinstance(handler, int):
+            handlers.pop(handler, None)
+        else:
+            for key in [k for k, h in handlers.items() if h == handler]:
+                del handlers[key]
     
-    def off(self, event_type: str, handler: Callable) -> None:
-        """Unregister event handler"""
-        if event_type in self.events:
-            self.events[event_type] = [h for h in self.events[event_type] if h != handler]
+    def _dispatch(self, handlers: Dict[int, Callable], event: Event) -> None:
+        """Call handlers in order, on()/off() from inside them apply once the outermost dispatch returns"""
+        self._dispatching += 1
+        try:
+            for handler in handlers.values():
+                handler(self, event)
+        finally:
+            self._dispatching -= 1
+            if not self._dispatching and self._deferred:
+                deferred, self._deferred = self._deferred, []
+                for slot, key, handler in deferred:
+                    if key is None:
+                        self._remove_handler(slot, handler)
+                    else:
+                        getattr(self, slot)[key] = handler
     
     def trigger(self, event_type: str, event: Event) -> None:
         """Trigger all handlers for event type"""
-        for handler in self.events[event_type]:
-            handler(self, event)
+        handlers = getattr(self, EVENT_SLOTS[event_type])
+        if handlers:
+            self._dispatch(handlers, event)
     
     # Geometry-dependent methods
     def is_inside(self, point: Tuple[int, int]) -> bool:
         """Check if point is inside component bounds"""
         return self.get_absolute_rect().collidepoint(point)
     
+    def subtree(self) -> List['Component']:
+        """This component and all descendants, in preorder"""
+        nodes = []
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            nodes.append(node)
+            stack.extend(reversed(node.children))
+        return nodes
+    
     def contains_point(self, point: Tuple[int, int]) -> bool:
         """Check if point is within this component or any children"""
-        return self.is_inside(point) or any(
-            child.contains_point(point) for child in self.children
-        )
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node.get_absolute_rect().collidepoint(point):
+                return True
+            stack.extend(node.children)
+        return False
     
     # Geometry contract (must implement)
     def get_absolute_rect(self) -> pygame.Rect:
@@ -140,9 +278,7 @@ class Messenger:
         self.address = -1
     
     def register_all(self, bus: AddressBus) -> None:
-        bus.register(self)
-        for child in self.children:
-            child.register_all(bus)
+        bus.register_many(self.subtree())
     
     def get_metadata(self) -> dict:
         metadata = {
@@ -153,7 +289,7 @@ class Messenger:
             'y'         : self.rect.y, 
             'width'     : self.rect.width, 
             'height'    : self.rect.height, 
-            'time'      : time.time()
+            'time'      : time.monotonic()
         }
         # is window?
         if self and hasattr(self, 'can_move'):
@@ -166,43 +302,75 @@ class Messenger:
         return metadata
         
     def handle_message(self, msg: Packet) -> None:
-        if msg.sender == self.address:
-            return
-        if msg.rs == Response.M_PING:
-            self.send_pong(msg)
-        elif msg.rs == Response.M_PONG:
-            pass # silently
-        elif msg.rs == Response.M_SHUTDOWN:
-            self.destroy()
-        elif msg.rs == Response.M_REDRAW:
-            self.reset()
-        elif msg.rs == Response.M_THEME:
-            self.bg         = pygame.Color(msg.data['bg'])
-            self.fg         = pygame.Color(msg.data['fg'])
-            self.shade      = pygame.Color(msg.data['shade'])
-            self.font_small = pygame.Color(msg.data['font_small'])
-            self.font_big   = pygame.Color(msg.data['font_big'])
-            self.hue        = int(msg.data['hue'])
-            self.contrast   = float(msg.data['contrast'])
-            self.reset()
-        elif msg.rs == Response.M_LOCK:
-            pass # silently
-        elif msg.rs == Response.M_CONTRAST:
-            self.contrast = float(msg.data)
-            self.reset()
+        # the bus never delivers a packet back to its sender
+        handler = self._MSG_HANDLERS.get(msg.rs)
+        if handler:
+            handler(self, msg)
+
+    def _msg_shutdown(self, msg: Packet) -> None:
+        self.destroy()
+
+    def _msg_redraw(self, msg: Packet) -> None:
+        self.reset()
+
+    def _msg_theme(self, msg: Packet) -> None:
+        theme = msg.data
+        # shared, read-only Colors from the palette cache (no per-receiver copies)
+        self.bg         = theme.bg
+        self.fg         = theme.fg
+        self.shade      = theme.shade
+        self.font_small = theme.font_small
+        self.font_big   = theme.font_big
+        self.hue        = int(theme.hue)
+        self.contrast   = float(theme.contrast)
+        self.reset()
+
+    def _msg_contrast(self, msg: Packet) -> None:
+        self.contrast = float(msg.data)
+        self.reset()
     
     # API
     
     def send_ping(self, reveiver: int = BROADCAST) -> None:
         hoster = self.root()
-        if hasattr(hoster, 'bus'):
+        if hoster.bus is not None:
             hoster.bus.post(Packet(receiver=reveiver,sender=self.address, rs=Response.M_PING, data=self.get_metadata()))
     
     def send_pong(self, msg: Packet) -> None:
         hoster = self.root()
-        if hasattr(hoster, 'bus'):
+        if hoster.bus is not None:
             hoster.bus.post(Packet(receiver=msg.sender,sender=self.address, rs=Response.M_PONG, data=self.get_metadata()))
     
+    # response -> handler, shared by all instances (M_PONG, M_LOCK are ignored)
+    _MSG_HANDLERS: Dict[int, Callable[['Messenger', Packet], None]] = {
+        Response.M_PING     : send_pong,
+        Response.M_SHUTDOWN : _msg_shutdown,
+        Response.M_REDRAW   : _msg_redraw,
+        Response.M_THEME    : _msg_theme,
+        Response.M_CONTRAST : _msg_contrast,
+    }
+    
+@lru_cache(maxsize=None)
+def load_font(path: str, size: int) -> pygame.font.Font:
+    """Load a font once, every component shares the same instance"""
+    return pygame.font.Font(path, size)
+
+@lru_cache(maxsize=2048)
+def render_text(font: pygame.font.Font, text: str, color: Tuple[int, ...]) -> pygame.Surface:
+    """Render antialiased text once per (font, text, color), callers only blit it"""
+    return font.render(text, True, color)
+
+@lru_cache(maxsize=4096)
+def text_width(font: pygame.font.Font, text: str) -> int:
+    """Pixel width of text, layout code asks for the same strings every frame"""
+    return font.size(text)[0]
+
+def clear_font_caches() -> None:
+    """Drop cached fonts and everything keyed on them, call before pygame.quit()"""
+    render_text.cache_clear()
+    text_width.cache_clear()
+    load_font.cache_clear()
+
 class Theme:
     def __init__(self):
         # Default Border & Filler
@@ -227,9 +395,17 @@ class Theme:
         # Default fonts
         self.font_big       = pygame.Color(255, 255, 255)
         self.font_small     = pygame.Color(155, 155, 155)
-        self.font           = pygame.font.Font('./assets/JetBrainsMono-Regular.ttf', 12)
-        self.fontS          = pygame.font.Font('./assets/JetBrainsMono-Thin.ttf', 11)
-        self.fontB          = pygame.font.Font('./assets/JetBrainsMono-Bold.ttf', 15)
+        self.font           = load_font('./assets/JetBrainsMono-Regular.ttf', 12)
+        self.fontS          = load_font('./assets/JetBrainsMono-Thin.ttf', 11)
+        self.fontB          = load_font('./assets/JetBrainsMono-Bold.ttf', 15)
+    
+    def render(self, font: pygame.font.Font, text: str, color: pygame.Color) -> pygame.Surface:
+        """Cached text surface (shared, do not draw onto it)"""
+        return render_text(font, text, tuple(color))
+    
+    def measure(self, font: pygame.font.Font, text: str) -> int:
+        """Cached text width in pixels"""
+        return text_width(font, text)
     
     def draw_frame(self, surface: pygame.Surface) -> None:
         if not self.visible or not self.border:
@@ -265,57 +441,71 @@ class Theme:
 
     def _draw_dashed_line(self, surface: pygame.Surface, start: Tuple[int, int], end: Tuple[int, int], color: pygame.Color, thickness: int, dash_len: int, gap_len: int) -> None:
         x1, y1 = start
-        x2, y2 = end
-        dx = x2 - x1
-        dy = y2 - y1
+        for sx, sy, ex, ey in Theme._dash_segments(end[0] - x1, end[1] - y1, dash_len, gap_len):
+            pygame.draw.line(surface, color, (x1 + sx, y1 + sy), (x1 + ex, y1 + ey), thickness)
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _dash_segments(dx: int, dy: int, dash_len: int, gap_len: int) -> Tuple[Tuple[int, int, int, int], ...]:
+        """Dash endpoints relative to the line start, borders reuse them every frame"""
         length = max(abs(dx), abs(dy))
         if length == 0:
-            return
+            return ()
 
         # Normalize direction
         step_x = dx / length
         step_y = dy / length
 
-        pos = 0.0
-        drawing = True
-        while pos < length:
-            seg_len = dash_len if drawing else gap_len
-            next_pos = min(pos + seg_len, length)
-            
-            if drawing:
-                sx = int(x1 + pos * step_x)
-                sy = int(y1 + pos * step_y)
-                ex = int(x1 + next_pos * step_x)
-                ey = int(y1 + next_pos * step_y)
-                pygame.draw.line(surface, color, (sx, sy), (ex, ey), thickness)
-            
-            pos = next_pos
-            drawing = not drawing
+        segments = []
+        period = dash_len + gap_len
+        for pos in range(0, length, period):
+            next_pos = min(pos + dash_len, length)
+            segments.append((math.floor(pos * step_x), math.floor(pos * step_y),
+                             math.floor(next_pos * step_x), math.floor(next_pos * step_y)))
+        return tuple(segments)
     
     def fill_region(self, surface: pygame.Surface, pattern: int = 0) -> None:
         abs_rect = self.get_absolute_rect()
         
         if pattern == 0: # solid
             pygame.draw.rect(surface, self.bg, abs_rect)
-        elif pattern == 1: # wireframe
-            for y in range(abs_rect.y, abs_rect.bottom, 4):
-                pygame.draw.line(surface, self.shade, (abs_rect.x, y), (abs_rect.right, y), 1)
+        elif 1 <= pattern <= 4:
+            tile = Theme._pattern_surface(pattern, abs_rect.width, abs_rect.height,
+                                          tuple(self.bg), tuple(self.shade))
+            surface.blit(tile, abs_rect.topleft)
+    
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _pattern_surface(pattern: int, w: int, h: int, bg: Tuple[int, ...], shade: Tuple[int, ...]) -> pygame.Surface:
+        """Render a fill pattern once per size and palette, fill_region blits it"""
+        if pattern == 4:
+            tile = pygame.Surface((w, h))
+        else:
+            tile = pygame.Surface((w, h), pygame.SRCALPHA)
+        bg = pygame.Color(bg)
+        shade = pygame.Color(shade)
+        
+        if pattern == 1: # wireframe
+            for y in range(0, h, 4):
+                pygame.draw.line(tile, shade, (0, y), (w, y), 1)
         elif pattern == 2: # lines
-            for y in range(abs_rect.y, abs_rect.bottom, 3):
-                pygame.draw.line(surface, self.shade, (abs_rect.x, y), (abs_rect.right, y), 1)
-            for x in range(abs_rect.x, abs_rect.right, 3):
-                pygame.draw.line(surface, self.shade, (x, abs_rect.y), (x, abs_rect.bottom), 1)
+            for y in range(0, h, 3):
+                pygame.draw.line(tile, shade, (0, y), (w, y), 1)
+            for x in range(0, w, 3):
+                pygame.draw.line(tile, shade, (x, 0), (x, h), 1)
         elif pattern == 3: # crossed
-            for y in range(abs_rect.y + 2, abs_rect.bottom, 4):
-                for x in range(abs_rect.x + 2, abs_rect.right, 4):
-                    surface.set_at((x, y), self.shade)
+            for y in range(2, h, 4):
+                for x in range(2, w, 4):
+                    tile.set_at((x, y), shade)
         elif pattern == 4: # gradients
-            for i, y in enumerate(range(abs_rect.y, abs_rect.bottom)):
-                ratio = i / abs_rect.height
-                color = self._color_lerp(self.shade, self.bg, ratio)
-                pygame.draw.line(surface, color, (abs_rect.x, y), (abs_rect.right, y))
+            # one pixel column, stretched horizontally in C
+            column = pygame.Surface((1, h))
+            for y in range(h):
+                column.set_at((0, y), Theme._color_lerp(shade, bg, y / h))
+            pygame.transform.scale(column, (w, h), tile)
+        return tile
     
-    def new_theme(self, base_hue: int = -1, contrast: float = 0.0) -> Dict[str, Tuple[int, int, int]]:
+    def new_theme(self, base_hue: int = -1, contrast: float = 0.0) -> ThemeColors:
         if base_hue == -1:
             self.hue = random.randint(0, 360)
         else:
@@ -323,31 +513,38 @@ class Theme:
         
         self.contrast = contrast
         
-        bg_lightness = max(10, min(40, 40 * (1 - self.contrast * 0.5)))  # 10-40
-        fg_lightness = min(95, 60 + (self.contrast * 35))                # 60-95
+        # slider drags repeat the same perceptual values, quantize for cache hits
+        return Theme._compute_theme(int(self.hue), round(self.contrast, 2))
+    
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _compute_theme(base_hue: int, contrast: float) -> ThemeColors:
+        bg_lightness = max(10, min(40, 40 * (1 - contrast * 0.5)))       # 10-40
+        fg_lightness = min(95, 60 + (contrast * 35))                     # 60-95
         
         shade_lightness = (bg_lightness + fg_lightness) // 2             # Midpoint
         
-        bg_saturation = max(5, min(25, 25 * (1 - self.contrast * 0.3)))  # 5-25
-        fg_saturation = min(90, 70 + (self.contrast * 20))               # 70-90
+        bg_saturation = max(5, min(25, 25 * (1 - contrast * 0.3)))       # 5-25
+        fg_saturation = min(90, 70 + (contrast * 20))                    # 70-90
         
         shade_saturation = (bg_saturation + fg_saturation) // 2          # Midpoint
         font_lightness = fg_lightness
         font_saturation = fg_saturation
         
-        return {
-            'bg':        Theme._hsl_to_rgb(base_hue, bg_saturation, bg_lightness),      # Background
-            'fg':        Theme._hsl_to_rgb(base_hue, fg_saturation, fg_lightness),      # Foreground/Border
-            'shade':     Theme._hsl_to_rgb(base_hue, shade_saturation, shade_lightness), # Secondary
+        return ThemeColors(
+            bg          = pygame.Color(Theme._hsl_to_rgb(base_hue, bg_saturation, bg_lightness)),        # Background
+            fg          = pygame.Color(Theme._hsl_to_rgb(base_hue, fg_saturation, fg_lightness)),        # Foreground/Border
+            shade       = pygame.Color(Theme._hsl_to_rgb(base_hue, shade_saturation, shade_lightness)),  # Secondary
             
-            'font_small': Theme._hsl_to_rgb(base_hue, font_saturation, min(90, font_lightness + 10)),  # Text
-            'font_big':   Theme._hsl_to_rgb(base_hue, font_saturation, min(100, font_lightness + 15)), # Headers
+            font_small  = pygame.Color(Theme._hsl_to_rgb(base_hue, font_saturation, min(90, font_lightness + 10))),  # Text
+            font_big    = pygame.Color(Theme._hsl_to_rgb(base_hue, font_saturation, min(100, font_lightness + 15))), # Headers
             
-            'hue':        self.hue,      # style metadata
-            'contrast':   self.contrast, # style metadata
-        }
+            hue         = base_hue,     # style metadata
+            contrast    = contrast,     # style metadata
+        )
             
-    def _color_lerp(self, color1: pygame.Color, color2: pygame.Color, ratio: float) -> pygame.Color:
+    @staticmethod
+    def _color_lerp(color1: pygame.Color, color2: pygame.Color, ratio: float) -> pygame.Color:
         """Interpolate between two colors"""
         r = int(color1.r + (color2.r - color1.r) * ratio)
         g = int(color1.g + (color2.g - color1.g) * ratio)
@@ -355,8 +552,18 @@ class Theme:
         return pygame.Color(r, g, b)
    
     @staticmethod
+    def _hue_to_rgb(p: float, q: float, t: float) -> float:
+        if t < 0: t += 1
+        if t > 1: t -= 1
+        if t < 1/6: return p + (q - p) * 6 * t
+        if t < 1/2: return q
+        if t < 2/3: return p + (q - p) * (2/3 - t) * 6
+        return p
+   
+    @staticmethod
+    @lru_cache(maxsize=1024)
     def _hsl_to_rgb(h: int, s: int, l: int) -> Tuple[int, int, int]:
-        """Convert HSL to RGB tuple"""
+        """Convert HSL to RGB tuple (memoized, the palette inputs repeat)"""
         h = h / 360.0
         s = s / 100.0
         l = l / 100.0
@@ -364,14 +571,7 @@ class Theme:
         if s == 0:
             rgb = l, l, l
         else:
-            def hue_to_rgb(p, q, t):
-                if t < 0: t += 1
-                if t > 1: t -= 1
-                if t < 1/6: return p + (q - p) * 6 * t
-                if t < 1/2: return q
-                if t < 2/3: return p + (q - p) * (2/3 - t) * 6
-                return p
-            
+            hue_to_rgb = Theme._hue_to_rgb
             q = l * (1 + s) if l < 0.5 else l + s - l * s
             p = 2 * l - q
             
@@ -10,6 +10,8 @@ class Component(Dispatcher, Messenger, Theme):
     def __init__(self, x: int = 0, y: int = 0, width: int = 128, height: int = 64):
         # initializers
         self.rect = pygame.Rect(x, y, max(1, width), max(1, height))
+        self._abs_rect: Optional[pygame.Rect] = None
+        self._root_cache: 'Component' = self  # kept current by add/remove
         Theme.__init__(self)
         Dispatcher.__init__(self)
         Messenger.__init__(self)
@@ -32,49 +34,106 @@ class Component(Dispatcher, Messenger, Theme):
             child.parent.remove(child)
         self.children.append(child)
         child.parent = self
+        child.reset_rect()
+        child._propagate_root(self.root())
+        if not child._cullable:
+            self._uncull()
+        self.reset()
+    
+    def add_many(self, children: List['Component']) -> None:
+        """Attach several children with a single reset"""
+        for child in children:
+            if child.parent:
+                child.parent.remove(child)
+            child.parent = self
+            child.reset_rect()
+            child._propagate_root(self.root())
+            if not child._cullable:
+                self._uncull()
+        self.children.extend(children)
         self.reset()
     
     def remove(self, child: 'Component') -> None:
-        if child in self.children:
+        try:
             self.children.remove(child)
-            child.parent = None
-            self.reset()
+        except ValueError:
+            return
+        if self._active_child is child:
+            self._active_child = None
+        child.parent = None
+        child.reset_rect()
+        child._propagate_root(child)
+        self.reset()
     
     def root(self) -> 'Component':
-        if not hasattr(self, '_root_cache'):
-            self._root_cache = self if self.parent is None else self.parent.root()
         return self._root_cache
     
     def destroy(self) -> None:
+        # request a repaint while still attached
+        self.reset()
         hoster = self.root()
-        for child in self.children[:]:
-            if hasattr(hoster, 'bus'):
-                hoster.bus.unregister(child)
+        bus = hoster.bus
+        children = self.children
+        while children:
+            child = children.pop()
+            if bus:
+                bus.unregister(child)
             child.destroy()
-        self.children.clear()
         self.parent = None
+        self._root_cache = self
         self.terminated = True
         self.rect = pygame.Rect(self.rect.x, self.rect.y, self.rect.w, 16)
+        self.reset_rect()
     
-    def reset(self) -> None:
+    def reset(self, area: Optional[pygame.Rect] = None) -> None:
+        """Flag for redraw and report the dirty screen area up to the root"""
         self.redraw = True
         if self.parent: 
-            self.parent.reset()
+            self.parent.reset(area if area is not None else self.get_absolute_rect())
 
     def reset_cache(self):
-        if hasattr(self, '_root_cache'):
-            del self._root_cache
-        for child in self.children:
-            child.reset_cache()
+        """Recompute the root of this subtree from the parent chain"""
+        node = self
+        while node.parent is not None:
+            node = node.parent
+        self._propagate_root(node)
+
+    def _propagate_root(self, root: 'Component') -> None:
+        """Point the root cache of this subtree at root"""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            node._root_cache = root
+            stack.extend(node.children)
+
+    def _geometry_changed(self) -> None:
+        old = self._abs_rect
+        self.reset_rect()
+        if old is None:
+            # never drawn here (or position unknown): repaint everything
+            self.root().reset()
+        elif self.parent:
+            # uncover where we were
+            self.parent.reset(old)
+        self.reset()
+
+    def reset_rect(self) -> None:
+        """Drop the cached absolute rect of this component and its descendants"""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            node._abs_rect = None
+            stack.extend(node.children)
     
     def bring_to_front(self) -> None:
-        if self.parent:
+        # already on top: no reorder, no repaint
+        if self.parent and self.parent.children[-1] is not self:
             self.parent.children.remove(self)
             self.parent.children.append(self)
             self.parent.reset()
     
     def send_to_back(self) -> None:
-        if self.parent:
+        if self.parent and self.parent.children[0] is not self:
             self.parent.children.remove(self)
             self.parent.children.insert(0, self)
             self.parent.reset()
@@ -86,50 +145,64 @@ class Component(Dispatcher, Messenger, Theme):
         abs_rect = self.get_absolute_rect()
         old_clip = surface.get_clip()
         try:
-            surface.set_clip(abs_rect)
+            surface.set_clip(abs_rect.clip(old_clip))
             for child in self.children:
                 child.draw(surface)
         finally:
             surface.set_clip(old_clip)
     
     def get_absolute_rect(self) -> pygame.Rect:
-        x, y = self.rect.topleft
-        parent = self.parent
-        while parent:
-            x += parent.rect.x
-            y += parent.rect.y
-            parent = parent.parent
-        return pygame.Rect(x, y, self.rect.width, self.rect.height)
+        """Screen-space rect, cached until reset_rect() (do not mutate)"""
+        if self._abs_rect is None:
+            if self.parent:
+                self._abs_rect = self.rect.move(self.parent.get_absolute_rect().topleft)
+            else:
+                self._abs_rect = self.rect.copy()
+        return self._abs_rect
+    
+    def is_inside(self, point: Tuple[int, int]) -> bool:
+        """Check if point is inside component bounds (hit path, reads the cache directly)"""
+        rect = self._abs_rect
+        if rect is None:
+            rect = self.get_absolute_rect()
+        return rect.collidepoint(point)
     
     # PROPERTIES
     @property
     def x(self) -> int: return self.rect.x
     @x.setter
-    def x(self, value: int): self.rect.x = value; self.reset()
+    def x(self, value: int):
+        if value != self.rect.x: self.rect.x = value; self._geometry_changed()
     
     @property
     def y(self) -> int: return self.rect.y
     @y.setter
-    def y(self, value: int): self.rect.y = value; self.reset()
+    def y(self, value: int):
+        if value != self.rect.y: self.rect.y = value; self._geometry_changed()
     
     @property
     def width(self) -> int: return self.rect.width
     @width.setter
-    def width(self, value: int): self.rect.width = max(1, value); self.reset()
+    def width(self, value: int):
+        value = max(1, value)
+        if value != self.rect.width: self.rect.width = value; self._geometry_changed()
     
     @property
     def height(self) -> int: return self.rect.height
     @height.setter
-    def height(self, value: int): self.rect.height = max(1, value); self.reset()
+    def height(self, value: int):
+        value = max(1, value)
+        if value != self.rect.height: self.rect.height = value; self._geometry_changed()
     
     @property
     def position(self) -> Tuple[int, int]: return (self.rect.x, self.rect.y)
     @position.setter
-    def position(self, value: Tuple[int, int]): self.rect.x, self.rect.y = value; self.reset()
+    def position(self, value: Tuple[int, int]):
+        if tuple(value) != self.rect.topleft: self.rect.x, self.rect.y = value; self._geometry_changed()
     
     @property
     def size(self) -> Tuple[int, int]: return (self.rect.width, self.rect.height)
     @size.setter
     def size(self, value: Tuple[int, int]): 
-        self.rect.width, self.rect.height = max(1, value[0]), max(1, value[1])
-        self.reset()
\ No newline at end of file
+        value = (max(1, value[0]), max(1, value[1]))
+        if value != self.rect.size: self.rect.width, self.rect.height = value; self._geometry_changed()
\ No newline at end of file
@@ -1,13 +1,40 @@
 import pygame
-import time
 import json
 import os
-import random
+import tempfile
 import traceback
+from concurrent.futures import ThreadPoolExecutor, Future
 from typing import List, Any, Tuple, Callable, Optional
 from component import Component
+from chain import clear_font_caches
 from bus import BROADCAST, MASTER, Response, Packet, AddressBus
 
+# ─── Redraw Scheduler ─────────────────────────────────────────────────
+
+class RedrawScheduler:
+    """Folds any number of redraw requests into one dirty rect per frame"""
+    def __init__(self, bounds: pygame.Rect):
+        self.bounds = bounds.copy()
+        self.dirty: Optional[pygame.Rect] = self.bounds.copy()
+    
+    def schedule(self, area: Optional[pygame.Rect] = None) -> None:
+        """Mark area for repaint, None marks the whole screen"""
+        if area is None:
+            self.dirty = self.bounds.copy()
+        elif self.dirty is None:
+            self.dirty = area.copy()
+        else:
+            self.dirty.union_ip(area)
+    
+    def consume(self) -> Optional[pygame.Rect]:
+        """On-screen area requested since the last call, None if nothing changed"""
+        dirty = self.dirty
+        self.dirty = None
+        if dirty is None:
+            return None
+        dirty = dirty.clip(self.bounds)
+        return dirty if dirty.width and dirty.height else None
+
 # ─── Engine ───────────────────────────────────────────────────────────
 
 class Engine(Component):
@@ -22,25 +49,79 @@ class Engine(Component):
         self.fps = fps
         self.running = False
         self.bus = AddressBus()
-        self.bus_freq = 0.2
-        self.bus_accumulator = 0.0
+        self.bus_freq = 0.2                          # s, bus_period/idle_timeout follow it
+        self.bus_accumulator = 0                     # ms, integer so the cadence never drifts
+        self.scheduler = RedrawScheduler(self.surface.get_rect())
+        self.clear_color = pygame.Color(0, 0, 0)
         self.bus.register(self)
+        # only queue the event types the component tree reacts to
+        self.event_types = (pygame.QUIT, pygame.VIDEOEXPOSE) + self.ACCEPTED_EVENTS
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(self.event_types)
         self.current_hue = 180.0
         self.current_contrast = 0.7
         self.profile = './assets/profile.json'
+        self.verbose = False  # trace bus traffic
+        self.io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='engine-io')
+        self.io_closed = False
         
         
     def root(self) -> 'Component':
         return self
     
-    def handle_message(self, msg: Packet) -> None:
-        super().handle_message(msg)
+    @property
+    def bus_period(self) -> int:
+        """Bus pump interval in ms, derived from bus_freq so runtime changes apply"""
+        return int(self.bus_freq * 1000)
+    
+    @property
+    def idle_timeout(self) -> int:
+        """Longest idle sleep in ms, wakes up in time for the next bus pump"""
+        return self.bus_period
+    
+    def reset(self, area: Optional[pygame.Rect] = None) -> None:
+        # every component reset bubbles up to here with its screen area
+        super().reset(area)
+        self.scheduler.schedule(area)
+    
+    def draw(self, surface: pygame.Surface) -> None:
+        if not self.visible:
+            return
+        if self.filler:
+            self.fill_region(surface, self.filler_style)
+        if self.border:
+            self.draw_frame(surface)
+        for child in self.exposed_children():
+            child.draw(surface)
+    
+    def exposed_children(self) -> List['Component']:
+        """Visible top-level children not fully covered by an opaque one above (z-order)"""
+        covers = []
+        exposed = []
+        for child in reversed(self.children):
+            if not child.visible:
+                continue
+            rect = child.get_absolute_rect()
+            if any(cover.contains(rect) for cover in covers):
+                continue
+            exposed.append(child)
+            # solid fill hides whatever is underneath
+            if child.filler and child.filler_style == 0:
+                covers.append(rect)
+        exposed.reverse()
+        return exposed
     
     def add(self, child: 'Component') -> None:
         super().add(child)
         self.bus.register(child)
         print(f'[engine] created {child.name} at address {child.address}')
         
+    def add_many(self, children: List['Component']) -> None:
+        super().add_many(children)
+        self.bus.register_many(children)
+        for child in children:
+            print(f'[engine] created {child.name} at address {child.address}')
+        
     def remove(self, child: 'Component') -> None:
         super().remove(child)
         self.bus.unregister(child)
@@ -48,10 +129,18 @@ class Engine(Component):
         
     def run(self) -> None:
         closing = False
+        idle = False
         self.running = True
         try:
             while self.running:
-                for event in pygame.event.get():
+                events = pygame.event.get(self.event_types)
+                if not events and idle:
+                    # nothing animating or queued: sleep until input or the next bus tick
+                    event = pygame.event.wait(self.idle_timeout)
+                    if event.type != pygame.NOEVENT:
+                        events = [event]
+                
+                for event in events:
                     if event.type == pygame.QUIT:
                         self.destroy()
                         closing = True
@@ -59,20 +148,26 @@ class Engine(Component):
                     #if not closing:
                     self.handle_event(event)
                 
-                self.dt = self.clock.tick(self.fps) / 1000.0
+                elapsed = self.clock.tick(self.fps)
+                self.dt = elapsed / 1000.0
                 
                 # throttle bus pump
-                self.bus_accumulator += self.dt
-                if self.bus_accumulator >= self.bus_freq:
+                self.bus_accumulator += elapsed
+                if self.bus_accumulator >= self.bus_period:
                     self.bus.pump()
-                    self.bus_accumulator = 0.0
+                    self.bus_accumulator = 0
                 
                 self.update(self.dt)
-                 
-                self.surface.fill((0, 0, 0))
-                self.draw(self.surface)
                 
-                pygame.display.flip()
+                # repaint only the area something asked for, frame cap is clock.tick
+                dirty = self.scheduler.consume()
+                idle = not dirty and not self.bus.pending()
+                if dirty:
+                    self.surface.set_clip(dirty)
+                    self.surface.fill(self.clear_color, dirty)
+                    self.draw(self.surface)
+                    self.surface.set_clip(None)
+                    pygame.display.update(dirty)
         except KeyboardInterrupt:
             print("Interrupted by user...")
             self.destroy()
@@ -81,9 +176,14 @@ class Engine(Component):
             print(f"Stack:\n{traceback.format_exc()}")
             self.destroy()
         finally:
+            # cached Font handles don't survive quit, a later Engine must reload them
+            clear_font_caches()
             pygame.quit()    
         
     def handle_event(self, event: pygame.event.Event) -> bool:
+        if event.type == pygame.VIDEOEXPOSE:
+            self.reset()
+            return True
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE:
                 self.running = False
@@ -98,22 +198,23 @@ class Engine(Component):
             rs=Response.M_SHUTDOWN,
             data=self.get_metadata()
         ))
+        # queued profile writes still finish, later saves run inline
+        self.io_closed = True
+        self.io_pool.shutdown(wait=False)
         super().destroy()
         
     def handle_message(self, msg: Packet) -> None:
-        if msg.sender == self.address:
-            return
-            
         if msg.rs == Response.M_BYE:
             defunkt = msg.data
             if defunkt and defunkt.terminated:
                 self.remove(defunkt)
                 
-        if not msg.rs == Response.M_PING:
+        if self.verbose and msg.rs != Response.M_PING:
+            name = msg.rs.name
             if msg.receiver  == BROADCAST:
-                print(f'[engine] * <BROADCAST:{msg.rs.name}> {msg.data}')
+                print(f'[engine] * <BROADCAST:{name}> {msg.data}')
             else:
-                print(f'[engine] * <{msg.sender}:{msg.rs.name}> {msg.data}')
+                print(f'[engine] * <{msg.sender}:{name}> {msg.data}')
         
         super().handle_message(msg)
     
@@ -158,24 +259,45 @@ class Engine(Component):
             self.text_brightness = 15
             return False
             
-    def save_profile(self) -> bool:
-        filepath = self.profile
-        try:
-            os.makedirs(os.path.dirname(filepath), exist_ok=True)
-            
-            profile = {
-                'profile': {
-                    'hue': getattr(self, 'hue', 180),
-                    'contrast': getattr(self, 'contrast', 0.7),
-                }
+    def save_profile(self) -> Future:
+        """Snapshot the theme and write it on the io thread, off the frame loop"""
+        profile = {
+            'profile': {
+                'hue': getattr(self, 'hue', 180),
+                'contrast': getattr(self, 'contrast', 0.7),
             }
+        }
+        if self.io_closed:
+            # shutting down (e.g. save and quit in one event batch): let queued
+            # writes land first so they can't overwrite this one, then write now
+            self.io_pool.shutdown(wait=True)
+            future = Future()
+            future.set_result(self._write_profile(self.profile, profile))
+            return future
+        return self.io_pool.submit(self._write_profile, self.profile, profile)
+    
+    def _write_profile(self, filepath: str, profile: dict) -> bool:
+        tmp_path = None
+        try:
+            directory = os.path.dirname(filepath) or '.'
+            os.makedirs(directory, exist_ok=True)
             
-            with open(filepath, 'w', encoding='utf-8') as f:
+            # write aside and swap in, load_profile never sees a half written file
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.profile-', suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
                 json.dump(profile, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, filepath)
+            tmp_path = None
             
             print(f'[engine] profile saved to {filepath}')
             return True
             
         except Exception as e:
             print(f'[engine] Failed to save theme profile: {e}')
-            return False
\ No newline at end of file
+            return False
+        finally:
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
\ No newline at end of file
@@ -23,6 +23,38 @@ class Style(IntEnum):
     NORMAL = 0
     SMALL = 1
     BIG = 2
+
+# text style -> Theme font attribute
+STYLE_FONTS = {
+    Style.NORMAL    : 'font',
+    Style.SMALL     : 'fontS',
+    Style.BIG       : 'fontB',
+}
+
+# alignment -> (Rect attribute, padding direction, divisor), anything else centers
+# divisor: share(size, divisor) is how far an item sits back from the anchor
+# (or into the free space from the start): all of it, half of it, or none
+H_ANCHORS = {
+    Alignment.LEFT  : ('left', 1, 0),
+    Alignment.RIGHT : ('right', -1, 1),
+}
+V_ANCHORS = {
+    Alignment.TOP   : ('top', 1, 0),
+    Alignment.BOTTOM: ('bottom', -1, 1),
+}
+H_CENTER = ('centerx', 0, 2)
+V_CENTER = ('centery', 0, 2)
+
+def place_text(text_rect: pygame.Rect, abs_rect: pygame.Rect, halign: Alignment, valign: Alignment, padding: int) -> None:
+    """Align text_rect inside abs_rect"""
+    attr, direction, _ = H_ANCHORS.get(halign, H_CENTER)
+    setattr(text_rect, attr, getattr(abs_rect, attr) + direction * padding)
+    attr, direction, _ = V_ANCHORS.get(valign, V_CENTER)
+    setattr(text_rect, attr, getattr(abs_rect, attr) + direction * padding)
+
+def share(size: int, divisor: int) -> int:
+    """Part of size an alignment divisor takes (all, half or none)"""
+    return size // divisor if divisor else 0
     
 """    
     Primitive Components
@@ -50,13 +82,14 @@ class Label(Component):
         super().__init__(x, y, width, height)
         self.name = 'Label'
         self._text = ""
+        # rendered text, dropped on text change and re-rendered on theme change
+        self._text_surface: Optional[pygame.Surface] = None
+        self._text_color: Optional[pygame.Color] = None
         self.padding = 4
         self.text_align = align
         self.text_valign = valign
         self.text_style = style
-        self._font = self.fontB if self.text_style == Style.BIG else \
-                     self.fontS if self.text_style == Style.SMALL else \
-                     self.font
+        self._font = getattr(self, STYLE_FONTS.get(self.text_style, 'font'))
         self.text = text
         self.filler = True
         self.filler_style = 4
@@ -71,6 +104,7 @@ class Label(Component):
         if self._text == value:
             return
         self._text = value
+        self._text_surface = None
         self.reset()
 
     def draw(self, surface: pygame.Surface) -> None:
@@ -81,26 +115,12 @@ class Label(Component):
         
         # text last
         if self.text:
-            text_surf = self._font.render(self.text, True, self.fg)
+            text_surf = self._text_surface
+            if text_surf is None or self._text_color is not self.fg:
+                text_surf = self._text_surface = self.render(self._font, self.text, self.fg)
+                self._text_color = self.fg
             text_rect = text_surf.get_rect()
-            
-            abs_rect = self.get_absolute_rect()
-            
-            # Horizontal alignment
-            if self.text_align == Alignment.LEFT:
-                text_rect.left = abs_rect.left + self.padding
-            elif self.text_align == Alignment.RIGHT:
-                text_rect.right = abs_rect.right - self.padding
-            else:  # center
-                text_rect.centerx = abs_rect.centerx
-            
-            # Vertical alignment
-            if self.text_valign == Alignment.TOP:
-                text_rect.top = abs_rect.top + self.padding
-            elif self.text_valign == Alignment.BOTTOM:
-                text_rect.bottom = abs_rect.bottom - self.padding
-            else:  # center
-                text_rect.centery = abs_rect.centery
+            place_text(text_rect, self.get_absolute_rect(), self.text_align, self.text_valign, self.padding)
             
             # Clip to bounds
             surface.blit(text_surf, text_rect)
@@ -115,14 +135,16 @@ class MultiLabel(Component):
         self.name = 'MultiLabel'
         self._text = ""
         self._lines = []
+        # rendered lines (None until first drawn), parallel to _lines
+        self._line_surfaces: List[Optional[pygame.Surface]] = []
+        self._lines_width = 0  # widest wrapped line
+        self._text_color: Optional[pygame.Color] = None
         self.padding = 2
         self.line_spacing = 2
         self.text_align = align
         self.text_valign = valign
         self.text_style = style
-        self._font = self.fontB if self.text_style == Style.BIG else \
-                     self.fontS if self.text_style == Style.SMALL else \
-                     self.font
+        self._font = getattr(self, STYLE_FONTS.get(self.text_style, 'font'))
         self.text = text
         self.filler = True
         self.filler_style = 0
@@ -145,6 +167,8 @@ class MultiLabel(Component):
     def _update_lines(self) -> None:
         """Precompute wrapped lines — called only on text/size change"""
         self._lines = []
+        self._line_surfaces = []
+        self._lines_width = 0
         if not self._text:
             return
 
@@ -152,6 +176,10 @@ class MultiLabel(Component):
         if avail_width <= 0:
             return
 
+        # widths add up word by word instead of re-measuring the growing line
+        font = self._font
+        space_width = self.measure(font, ' ')
+
         # Split into paragraphs (preserve \n)
         paragraphs = self._text.split('\n')
         for para in paragraphs:
@@ -161,14 +189,22 @@ class MultiLabel(Component):
             
             words = para.split(' ')
             current_line = ""
+            current_width = 0
             
             for word in words:
-                # Test adding this word to current line
-                test_line = f"{current_line} {word}".strip() if current_line else word
-                test_width = self._font.size(test_line)[0]
+                word_width = self.measure(font, word)
+                # Test adding this word to current line (repeated spaces collapse)
+                if not word:
+                    test_line, test_width = current_line, current_width
+                elif current_line:
+                    test_line = f"{current_line} {word}"
+                    test_width = current_width + space_width + word_width
+                else:
+                    test_line, test_width = word, word_width
                 
                 if test_width <= avail_width:
                     current_line = test_line
+                    current_width = test_width
                 else:
                     # If current line is empty, this word is too long for any line
                     if not current_line:
@@ -176,13 +212,18 @@ class MultiLabel(Component):
                         current_line = self._break_long_word(word, avail_width)
                         self._lines.append(current_line)
                         current_line = ""
+                        current_width = 0
                     else:
                         # Current line fits, but adding word doesn't - add current line and start new
                         self._lines.append(current_line)
                         current_line = word
+                        current_width = word_width
             
             if current_line:
                 self._lines.append(current_line)
+        
+        self._line_surfaces = [None] * len(self._lines)
+        self._lines_width = max(self.measure(font, line) for line in self._lines) if self._lines else 0
 
     def _break_long_word(self, word: str, max_width: int) -> str:
         """Break a word that's too long for the available width"""
@@ -196,7 +237,7 @@ class MultiLabel(Component):
         while left <= right:
             mid = (left + right) // 2
             test = word[:mid] + "…"
-            if self._font.size(test)[0] <= max_width:
+            if self.measure(self._font, test) <= max_width:
                 best = mid
                 left = mid + 1
             else:
@@ -221,40 +262,49 @@ class MultiLabel(Component):
 
         # Vertical start (respect valign)
         total_text_height = len(self._lines) * line_height - self.line_spacing
-        if self.text_valign == Alignment.TOP:
-            y = abs_rect.top + self.padding
-        elif self.text_valign == Alignment.BOTTOM:
-            y = abs_rect.bottom - self.padding - total_text_height
-        else:  # center
-            y = abs_rect.centery - total_text_height // 2
-
-        # Clip rendering to self bounds
-        old_clip = surface.get_clip()
+        attr, direction, divisor = V_ANCHORS.get(self.text_valign, V_CENTER)
+        y = getattr(abs_rect, attr) + direction * self.padding - share(total_text_height, divisor)
+
+        # Only lines that reach into our bounds are rendered
+        first = max(0, -((y + line_height - abs_rect.top) // line_height))
+        last = min(len(self._lines), (abs_rect.bottom - y) // line_height + 1)
+        y += first * line_height
+
+        # theme change: every cached line has the old color
+        surfaces = self._line_surfaces
+        if self._text_color is not self.fg:
+            surfaces[:] = [None] * len(surfaces)
+            self._text_color = self.fg
+
+        # Horizontal alignment is the same for every line: resolve it once,
+        # each line then shifts left by width // divisor
+        attr, direction, divisor = H_ANCHORS.get(self.text_align, H_CENTER)
+        anchor = getattr(abs_rect, attr) + direction * self.padding
+
+        # Clip rendering to self bounds, unless every line lies inside them
+        fits = (first == 0 and last == len(self._lines)
+                and y >= abs_rect.top and y + total_text_height <= abs_rect.bottom
+                and self._lines_width <= abs_rect.width - 2 * self.padding)
+        old_clip = None
+        if not fits:
+            old_clip = surface.get_clip()
+            surface.set_clip(abs_rect.clip(old_clip))
         try:
-            surface.set_clip(abs_rect)
-            for line in self._lines:
-                if y + line_height < abs_rect.top:
-                    y += line_height
-                    continue  # skip off-top lines
-                if y > abs_rect.bottom:
-                    break    # stop at bottom
-
-                # Render line
-                text_surf = self._font.render(line, True, self.fg)
-                text_rect = text_surf.get_rect()
-
-                if self.text_align == Alignment.LEFT:
-                    text_rect.left = abs_rect.left + self.padding
-                elif self.text_align == Alignment.RIGHT:
-                    text_rect.right = abs_rect.right - self.padding
-                else:  # center
-                    text_rect.centerx = abs_rect.centerx
-
-                text_rect.top = y
-                surface.blit(text_surf, text_rect)
+            # one blits() call for all visible lines
+            blits = []
+            for index in range(first, last):
+                # Render line (once)
+                text_surf = surfaces[index]
+                if text_surf is None:
+                    text_surf = surfaces[index] = self.render(self._font, self._lines[index], self.fg)
+
+                x = anchor - text_surf.get_width() // divisor if divisor else anchor
+                blits.append((text_surf, (x, y)))
                 y += line_height
+            surface.blits(blits, doreturn=False)
         finally:
-            surface.set_clip(old_clip)
+            if old_clip is not None:
+                surface.set_clip(old_clip)
 
 class Button(Component):
     def __init__(self, x: int = 0, y: int = 0, width: int = 80, height: int = 30, text: str = "OK",
@@ -266,19 +316,32 @@ class Button(Component):
         self.filler_style = 0
         self.border = True
         self.border_style = 0
+        self._text = ""
+        # rendered (possibly ellipsized) text and what it was rendered for
+        self._text_surface: Optional[pygame.Surface] = None
+        self._text_color: Optional[pygame.Color] = None
+        self._text_width = 0
         self.text = text
         self.padding = 4
         self.text_style = style
         self.text_align = align
         self.text_valign = valign
-        self.on_click: Optional[Callable[[], None]] = self._null
-        self._font = self.fontB if self.text_style == Style.BIG else \
-                     self.fontS if self.text_style == Style.SMALL else \
-                     self.font
+        self.on_click: Optional[Callable[[], None]] = None
+        self._font = getattr(self, STYLE_FONTS.get(self.text_style, 'font'))
+    
+    @property
+    def text(self) -> str:
+        return self._text
+    
+    @text.setter
+    def text(self, value: str):
+        value = str(value) if value else ""
+        if self._text == value:
+            return
+        self._text = value
+        self._text_surface = None
+        self.reset()
     
-    def _null(self) -> None:
-        return
-        
     def process_event(self, event: pygame.event.Event) -> bool:
         if event.type == pygame.MOUSEBUTTONUP and event.button == 1:
             if self.active and self.is_inside(event.pos):
@@ -287,6 +350,29 @@ class Button(Component):
                 return True
         return super().process_event(event)
 
+    def _render_text(self, max_width: int) -> pygame.Surface:
+        """Render the text, ellipsized to fit max_width"""
+        raw_text = self.text
+        text_width = self.measure(self._font, raw_text)
+        
+        if text_width > max_width:
+            ellipsis = "…"
+            ellipsis_w = self.measure(self._font, ellipsis)
+            avail = max(0, max_width - ellipsis_w)
+            # Binary search for the longest prefix that fits
+            left, right = 0, len(raw_text)
+            while left < right:
+                mid = (left + right + 1) // 2
+                if self.measure(self._font, raw_text[:mid]) <= avail:
+                    left = mid
+                else:
+                    right = mid - 1
+            display = raw_text[:left] + ellipsis
+        else:
+            display = raw_text
+        
+        return self.render(self._font, display, self.font_small)
+
     def draw(self, surface: pygame.Surface) -> None:
         if not self.visible:
             return
@@ -296,37 +382,15 @@ class Button(Component):
         if self.text:
             # Clip text to self bounds (uses active font + padding)
             max_width = self.width - 2 * self.padding
-            raw_text = self.text
-            text_width = self._font.size(raw_text)[0]
+            if (self._text_surface is None or self._text_width != max_width
+                    or self._text_color is not self.font_small):
+                self._text_surface = self._render_text(max_width)
+                self._text_width = max_width
+                self._text_color = self.font_small
             
-            if text_width > max_width:
-                ellipsis = "…"
-                ellipsis_w = self._font.size(ellipsis)[0]
-                avail = max(0, max_width - ellipsis_w)
-                display = ellipsis
-                for i in range(len(raw_text), 0, -1):
-                    trial = raw_text[:i]
-                    if self._font.size(trial)[0] <= avail:
-                        display = trial + ellipsis
-                        break
-            else:
-                display = raw_text
-            
-            text_surf = self._font.render(display, True, self.font_small)
+            text_surf = self._text_surface
             text_rect = text_surf.get_rect()
-            if self.text_align == Alignment.LEFT:
-                text_rect.left = abs_rect.left + self.padding
-            elif self.text_align == Alignment.RIGHT:
-                text_rect.right = abs_rect.right - self.padding
-            else:
-                text_rect.centerx = abs_rect.centerx
-            
-            if self.text_valign == Alignment.TOP:
-                text_rect.top = abs_rect.top + self.padding
-            elif self.text_valign == Alignment.BOTTOM:
-                text_rect.bottom = abs_rect.bottom - self.padding
-            else:
-                text_rect.centery = abs_rect.centery
+            place_text(text_rect, abs_rect, self.text_align, self.text_valign, self.padding)
             
             surface.blit(text_surf, text_rect)
 
@@ -342,6 +406,7 @@ class Toolbar(Component):
         self.spacing = 4
         self.padding = 4
         self.auto_reposition = True
+        self._layout_dirty = False
         
         # Alignment properties
         self.h_align = h_align  # Horizontal alignment for items
@@ -349,49 +414,62 @@ class Toolbar(Component):
         
     def add(self, child: 'Component') -> None:
         super().add(child)
-        if self.auto_reposition:
-            self.reposition_items()
+        self._layout_changed()
+    
+    def add_many(self, children: List['Component']) -> None:
+        super().add_many(children)
+        self._layout_changed()
     
     def remove(self, child: 'Component') -> None:
         super().remove(child)
+        self._layout_changed()
+    
+    def begin_batch(self) -> None:
+        """Defer repositioning until end_batch"""
+        self.auto_reposition = False
+    
+    def end_batch(self) -> None:
+        """Lay out once for everything added or removed since begin_batch"""
+        self.auto_reposition = True
+        if self._layout_dirty:
+            self.reposition_items()
+    
+    def _layout_changed(self) -> None:
+        self._layout_dirty = True
         if self.auto_reposition:
             self.reposition_items()
     
     def reposition_items(self) -> None:
-        if not self.children:
+        self._layout_dirty = False
+        children = self.children
+        if not children:
             return
 
-        total_content_width = sum(child.width for child in self.children) + \
-                             (len(self.children) - 1) * self.spacing
+        padding = self.padding
+        spacing = self.spacing
         
-        if self.h_align == Alignment.LEFT:
-            current_x = self.padding
-        elif self.h_align == Alignment.RIGHT:
-            current_x = self.width - self.padding - total_content_width
-        else:  # CENTER
-            current_x = self.padding + (self.width - 2 * self.padding - total_content_width) // 2
+        # items take the free space's share of the alignment (left/top: none),
+        # left aligned rows don't need the total width
+        current_x = padding
+        h_divisor = H_ANCHORS.get(self.h_align, H_CENTER)[2]
+        if h_divisor:
+            total_content_width = sum(child.width for child in children) + (len(children) - 1) * spacing
+            current_x += share(self.width - 2 * padding - total_content_width, h_divisor)
         
-        current_x = max(self.padding, current_x)  # Ensure not negative
+        current_x = max(padding, current_x)  # Ensure not negative
         
-        for child in self.children:
-            child.x = current_x
-            
-            available_height = self.height - 2 * self.padding
-            if self.v_align == Alignment.TOP:
-                child.y = self.padding
-            elif self.v_align == Alignment.BOTTOM:
-                child.y = self.height - self.padding - child.height
-            else:  # CENTER
-                child.y = self.padding + (available_height - child.height) // 2
+        v_divisor = V_ANCHORS.get(self.v_align, V_CENTER)[2]
+        available_height = self.height - 2 * padding
+        right_edge = self.width - padding
+        for child in children:
+            y = padding + share(available_height - child.height, v_divisor)
             
-            child.y = max(self.padding, min(child.y, self.height - child.height - self.padding))
-            current_x += child.width + self.spacing
-            if current_x > self.width - self.padding:
-                child.visible = False
-            else:
-                child.visible = True
-            if child.height > self.height - 2 * self.padding:
-                child.height = self.height - 2 * self.padding
+            # one geometry update per child
+            child.position = (current_x, max(padding, min(y, self.height - child.height - padding)))
+            current_x += child.width + spacing
+            child.visible = current_x <= right_edge
+            if child.height > available_height:
+                child.height = available_height
  
 class Slider(Component):
     def __init__(self, x: int = 0, y: int = 0, width: int = 100, height: int = 20, 
@@ -415,6 +493,8 @@ class Slider(Component):
         self.dragging = False
         self.knob_size = min(15, height - 4)
         self.knob_x = self._value_to_position(self.value)
+        self._knob_rect = pygame.Rect(0, 0, 0, 0)  # hit box, updated in place
+        self._pending_x: Optional[int] = None  # latest drag position, applied once per frame
         
         # Visual
         self.knob_color = self.fg
@@ -442,43 +522,56 @@ class Slider(Component):
         # Convert to actual value range
         return self.min_value + normalized * (self.max_value - self.min_value)
     
+    def _set_from_mouse(self, pos_x: int, abs_rect: pygame.Rect) -> None:
+        """Center the knob on pos_x and update the value"""
+        self.knob_x = max(self.padding, min(pos_x - abs_rect.x - self.knob_size // 2,
+                                            self.width - self.knob_size - self.padding))
+        self.value = self._position_to_value(self.knob_x + abs_rect.x)
+        if self.on_change:
+            self.on_change(self.value)
+        self.reset()
+    
+    def flush(self) -> None:
+        """Apply the last drag position queued this frame"""
+        if self._pending_x is not None:
+            pos_x, self._pending_x = self._pending_x, None
+            self._set_from_mouse(pos_x, self.get_absolute_rect())
+    
+    def update(self, dt: float) -> None:
+        self.flush()
+        super().update(dt)
+    
     def process_event(self, event: pygame.event.Event) -> bool:
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             abs_rect = self.get_absolute_rect()
             
-            # Check if click is on knob
-            knob_rect = pygame.Rect(self.knob_x, abs_rect.y + (abs_rect.height - self.knob_size) // 2, 
-                                   self.knob_size, self.knob_size)
+            # Check if click is on knob (same place draw puts it)
+            knob_rect = self._knob_rect
+            knob_rect.update(abs_rect.x + self.knob_x, abs_rect.y + (abs_rect.height - self.knob_size) // 2,
+                             self.knob_size, self.knob_size)
             
             if knob_rect.collidepoint(event.pos):
                 self.dragging = True  # Start dragging the knob
+                self.capture_pointer()
                 return True
             # Check if click is on track (jump to position and start dragging)
             elif abs_rect.collidepoint(event.pos):
-                self.knob_x = event.pos[0] - abs_rect.x - self.knob_size // 2
-                self.knob_x = max(self.padding, min(self.knob_x, 
-                                                  self.width - self.knob_size - self.padding))
-                self.value = self._position_to_value(self.knob_x + abs_rect.x)
-                if self.on_change:
-                    self.on_change(self.value)
+                self._set_from_mouse(event.pos[0], abs_rect)
                 self.dragging = True  # Start dragging after jump to position
-                self.reset()
+                self.capture_pointer()
                 return True
                 
         elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
             if self.dragging:
+                # motion queued this frame still lands before the release
+                self.flush()
                 self.dragging = False
+                self.release_pointer()
                 return True
                 
         elif event.type == pygame.MOUSEMOTION and self.dragging:
-            abs_rect = self.get_absolute_rect()
-            self.knob_x = event.pos[0] - abs_rect.x - self.knob_size // 2
-            self.knob_x = max(self.padding, min(self.knob_x, 
-                                              self.width - self.knob_size - self.padding))
-            self.value = self._position_to_value(self.knob_x + abs_rect.x)
-            if self.on_change:
-                self.on_change(self.value)
-            self.reset()
+            # several motions can arrive per frame, only the last one is applied
+            self._pending_x = event.pos[0]
             return True
             
         return super().process_event(event)
@@ -0,0 +1,56 @@
+import os
+import unittest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.chdir(os.path.dirname(os.path.abspath(__file__)))  # themes load ./assets fonts
+
+import pygame
+from component import Component
+from utilities import DummyLoad
+
+
+class CountingLoad(DummyLoad):
+    def __init__(self):
+        super().__init__(resistance=0.0)
+        self.events = []
+
+    def process_event(self, event: pygame.event.Event) -> bool:
+        self.events.append(event.type)
+        return super().process_event(event)
+
+
+class PointerCullTest(unittest.TestCase):
+    def setUp(self):
+        self.root = Component(0, 0, 400, 300)
+        self.window = Component(100, 100, 50, 50)
+        self.root.add(self.window)
+
+    def motion(self, pos):
+        return pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=(1, 1), buttons=(0, 0, 0))
+
+    def test_dummy_load_receives_motion_outside_window(self):
+        load = CountingLoad()
+        self.window.add(load)
+        self.root.handle_event(self.motion((5, 5)))
+        self.root.handle_event(pygame.event.Event(pygame.MOUSEBUTTONUP, pos=(5, 5), button=1))
+        self.assertEqual(load.events, [pygame.MOUSEMOTION, pygame.MOUSEBUTTONUP])
+
+    def test_dummy_load_added_in_batch(self):
+        load = CountingLoad()
+        self.window.add_many([Component(0, 0, 10, 10), load])
+        self.root.handle_event(self.motion((390, 290)))
+        self.assertEqual(load.events, [pygame.MOUSEMOTION])
+
+    def test_spatial_components_still_culled(self):
+        seen = []
+        child = Component(0, 0, 10, 10)
+        child.process_event = lambda event: seen.append(event.type) or False
+        self.window.add(child)
+        self.root.handle_event(self.motion((5, 5)))
+        self.assertEqual(seen, [])
+        self.root.handle_event(self.motion((105, 105)))
+        self.assertEqual(seen, [pygame.MOUSEMOTION])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,6 +2,7 @@ import time
 import pygame
 import random
 
+from collections import deque
 from enum import IntEnum
 from typing import List, Any, Dict, Tuple, Callable, Optional
 
@@ -11,6 +12,9 @@ from bus import BROADCAST, MASTER, Response, Packet, AddressBus
 
 
 class DummyLoad(Component):
+    # no area: pointer traffic must reach it wherever the cursor is
+    spatial = False
+    
     def __init__(self, resistance: float = 1.0):
         super().__init__(0, 0, 0, 0)
         self.name = 'DummyLoad'
@@ -61,8 +65,8 @@ class Performance(Component):
         
         # Data management
         self.window_data = {}  # address -> [time_series_data]
-        self.max_points = width  # One point per pixel width
-        self.graph_buffer = []  # Recent performance values
+        self.max_points = int(width)  # One point per pixel width
+        self.graph_buffer = deque(maxlen=self.max_points)  # Recent performance values
         self.update_interval = 1.0  # Update graph every 100ms
         self.last_update = 0
         
@@ -82,7 +86,8 @@ class Performance(Component):
         
         if msg.rs == Response.M_PONG and msg.data and msg.data.get('type') == 'Window':
             # Calculate time since the message was generated
-            current_time = time.time()
+            # metadata is stamped with time.monotonic(), wall clock jumps can't skew it
+            current_time = time.monotonic()
             if 'time' in msg.data:
                 response_time = current_time - msg.data['time']
                 self._add_performance_sample(response_time)
@@ -90,18 +95,15 @@ class Performance(Component):
     def _add_performance_sample(self, response_time: float):
         """Add a new performance sample to the graph"""
         # Cap the response time for display purposes
-        capped_time = min(response_time, self.max_display_time)
+        capped_time = min(max(0.0, response_time), self.max_display_time)
+        # bounded buffer drops the oldest point
         self.graph_buffer.append(capped_time)
         
-        # Keep only the last N points
-        if len(self.graph_buffer) > self.max_points:
-            self.graph_buffer.pop(0)
-        
-        self.redraw = True
+        self.reset()
     
     def update(self, dt: float) -> None:
         super().update(dt)
-        current_time = time.time()
+        current_time = time.monotonic()
         if current_time - self.last_update >= self.update_interval:
             self.send_ping()
             self.last_update = current_time
@@ -142,31 +144,38 @@ class Performance(Component):
         
         # Draw line segments connecting each point
         points = []
+        step = abs_rect.width / len(self.graph_buffer)
+        scale = abs_rect.height / self.max_display_time
         for i, response_time in enumerate(self.graph_buffer):
-            x = abs_rect.left + i * (abs_rect.width / len(self.graph_buffer))
-            y = abs_rect.bottom - (response_time / self.max_display_time) * abs_rect.height
+            x = abs_rect.left + i * step
+            y = abs_rect.bottom - response_time * scale
             y = max(abs_rect.top, min(y, abs_rect.bottom))  # Clamp to bounds
             points.append((x, y))
         
         if len(points) > 1:
             # Draw the line with color based on performance
-            for i in range(len(points) - 1):
-                start_point = points[i]
-                end_point = points[i + 1]
-                
-                # Choose color based on the first point's performance
-                response_time = self.graph_buffer[i]
-                if response_time < self.good_threshold:
-                    color = self.graph_color
-                elif response_time < self.warning_threshold:
-                    color = self.warning_color
-                else:
-                    color = self.error_color
-                
-                pygame.draw.line(surface, color, start_point, end_point, 2)
+            # (zip stops at the last point, deque indexing is not O(1))
+            # one lock for the whole curve instead of one per segment
+            surface.lock()
+            try:
+                for start_point, end_point, response_time in zip(points, points[1:], self.graph_buffer):
+                    # Choose color based on the first point's performance
+                    if response_time < self.good_threshold:
+                        color = self.graph_color
+                    elif response_time < self.warning_threshold:
+                        color = self.warning_color
+                    else:
+                        color = self.error_color
+                    
+                    pygame.draw.line(surface, color, start_point, end_point, 2)
+            finally:
+                surface.unlock()
 
 
 class Pulsar(Component):
+    # idle indicator, shared by all instances
+    DIM_COLOR = pygame.Color(30, 30, 30)
+    
     def __init__(self, x: int = 0, y: int = 0, width: int = 12, height: int = 12):
         super().__init__(x, y, width, height)
         self.name = 'Pulsar'
@@ -188,7 +197,7 @@ class Pulsar(Component):
         self.is_active = True
         self.activity_timer = self.activity_timeout
         self.pulse_phase = 0.0
-        self.redraw = True
+        self.reset()
     
     def update(self, dt: float) -> None:
         super().update(dt)
@@ -199,7 +208,7 @@ class Pulsar(Component):
             
             if self.activity_timer <= 0:
                 self.is_active = False
-            self.redraw = True
+            self.reset()
     
     def draw(self, surface: pygame.Surface) -> None:
         if not self.visible:
@@ -215,19 +224,16 @@ class Pulsar(Component):
         else:
             pulse_intensity = 0.0
         
-        # Create pulsing color
-        r = int(255 * pulse_intensity)
-        g = int(self.fg.g * pulse_intensity)
-        b = int(self.fg.b * pulse_intensity)
-        pulse_color = pygame.Color(r, g, b)
-        
         # Draw the indicator
         if pulse_intensity > 0:
+            # pulsing color (a plain tuple, draw.rect takes it as is)
+            pulse_color = (int(255 * pulse_intensity),
+                           int(self.fg.g * pulse_intensity),
+                           int(self.fg.b * pulse_intensity))
             pygame.draw.rect(surface, pulse_color, abs_rect)
         else:
             # Draw a dim indicator when not active
-            dim_color = pygame.Color(30, 30, 30)
-            pygame.draw.rect(surface, dim_color, abs_rect)
+            pygame.draw.rect(surface, self.DIM_COLOR, abs_rect)
         
         if self.border:
             pygame.draw.rect(surface, self.fg, abs_rect, 1)
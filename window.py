@@ -29,7 +29,7 @@ class WindowManagement(WindowRoot):
     def toggle_snap(self) -> None:
         self.can_snap = not self.can_snap
         hoster = self.root()
-        if hasattr(hoster, 'bus'):
+        if hoster.bus is not None:
             hoster.bus.post(Packet(
                 receiver=BROADCAST,
                 sender=self.address,
@@ -39,7 +39,7 @@ class WindowManagement(WindowRoot):
     def toggle_theme(self) -> None:
         hoster = self.root()
         theme = self.new_theme(-1, random.random())
-        if hasattr(hoster, 'bus'):
+        if hoster.bus is not None:
             hoster.bus.post(Packet(
                 receiver=BROADCAST,
                 sender=MASTER,
@@ -50,7 +50,7 @@ class WindowManagement(WindowRoot):
     def toggle_lock(self) -> None:
         self.can_move = not self.can_move
         hoster = self.root()
-        if hasattr(hoster, 'bus'):
+        if hoster.bus is not None:
             hoster.bus.post(Packet(
                 receiver=BROADCAST,
                 sender=self.address,
@@ -79,14 +79,19 @@ class WindowManagement(WindowRoot):
                 self.dragging = True
                 abs_rect = self.get_absolute_rect()
                 self.drag_offset = (event.pos[0] - abs_rect.x, event.pos[1] - abs_rect.y)
+                self.capture_pointer()
                 self.bring_to_front()
+                # border turns dashed while dragging
+                self.reset()
                 return True
                 
         elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
             if self.dragging:
                 self.dragging = False
+                self.release_pointer()
+                self.reset()
                 hoster = self.root()
-                if hasattr(hoster, 'bus'):
+                if hoster.bus is not None:
                     hoster.bus.post(Packet(
                         receiver=BROADCAST,
                         sender=self.address,
@@ -161,7 +166,7 @@ class Window(WindowManagement):
     def destroy(self) -> None:
         if self.can_close:
             hoster = self.root()
-            if hasattr(hoster, 'bus'):
+            if hoster.bus is not None:
                 hoster.bus.post(Packet(receiver=BROADCAST,sender=self.address, rs=Response.M_BYE, data=self))
             super().destroy()
     